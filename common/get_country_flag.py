@@ -1,200 +1,203 @@
+# Built once at import rather than on every call
+FLAG_MAPPINGS = {
+    # Major countries
+    "US": "🇺🇸",
+    "CA": "🇨🇦",
+    "MX": "🇲🇽",
+    "GB": "🇬🇧",
+    "FR": "🇫🇷",
+    "DE": "🇩🇪",
+    "IT": "🇮🇹",
+    "ES": "🇪🇸",
+    "RU": "🇷🇺",
+    "CN": "🇨🇳",
+    "JP": "🇯🇵",
+    "IN": "🇮🇳",
+    "AU": "🇦🇺",
+    "BR": "🇧🇷",
+    "AR": "🇦🇷",
+    # Europe
+    "AT": "🇦🇹",
+    "BE": "🇧🇪",
+    "BG": "🇧🇬",
+    "DK": "🇩🇰",
+    "FI": "🇫🇮",
+    "NL": "🇳🇱",
+    "NO": "🇳🇴",
+    "PL": "🇵🇱",
+    "PT": "🇵🇹",
+    "CZ": "🇨🇿",
+    "SE": "🇸🇪",
+    "CH": "🇨🇭",
+    "TR": "🇹🇷",
+    "RO": "🇷🇴",
+    "GR": "🇬🇷",
+    "HU": "🇭🇺",
+    "IE": "🇮🇪",
+    "IS": "🇮🇸",
+    "LU": "🇱🇺",
+    "MT": "🇲🇹",
+    "MC": "🇲🇨",
+    "CY": "🇨🇾",
+    "HR": "🇭🇷",
+    "SI": "🇸🇮",
+    "SK": "🇸🇰",
+    "LV": "🇱🇻",
+    "LT": "🇱🇹",
+    "EE": "🇪🇪",
+    "UA": "🇺🇦",
+    "BY": "🇧🇾",
+    "MD": "🇲🇩",
+    "AL": "🇦🇱",
+    "BA": "🇧🇦",
+    "MK": "🇲🇰",
+    "SM": "🇸🇲",
+    "YU": "🇷🇸",  # Yugoslavia (historical) - using Serbia flag
+    # Asia
+    "KR": "🇰🇷",
+    "KP": "🇰🇵",
+    "TH": "🇹🇭",
+    "VN": "🇻🇳",
+    "MY": "🇲🇾",
+    "SG": "🇸🇬",
+    "PH": "🇵🇭",
+    "ID": "🇮🇩",
+    "PK": "🇵🇰",
+    "BD": "🇧🇩",
+    "LK": "🇱🇰",
+    "MM": "🇲🇲",
+    "AF": "🇦🇫",
+    "IR": "🇮🇷",
+    "IQ": "🇮🇶",
+    "SA": "🇸🇦",
+    "AE": "🇦🇪",
+    "KW": "🇰🇼",
+    "QA": "🇶🇦",
+    "BH": "🇧🇭",
+    "OM": "🇴🇲",
+    "YE": "🇾🇪",
+    "JO": "🇯🇴",
+    "LB": "🇱🇧",
+    "SY": "🇸🇾",
+    "IL": "🇮🇱",
+    "TW": "🇹🇼",
+    "MN": "🇲🇳",
+    "KZ": "🇰🇿",
+    "UZ": "🇺🇿",
+    "KG": "🇰🇬",
+    "TJ": "🇹🇯",
+    "TM": "🇹🇲",
+    "AM": "🇦🇲",
+    "AZ": "🇦🇿",
+    "GE": "🇬🇪",
+    "LA": "🇱🇦",
+    "KH": "🇰🇭",
+    "BT": "🇧🇹",
+    "NP": "🇳🇵",
+    "BN": "🇧🇳",
+    # Africa
+    "EG": "🇪🇬",
+    "LY": "🇱🇾",
+    "MA": "🇲🇦",
+    "TN": "🇹🇳",
+    "DZ": "🇩🇿",
+    "ZA": "🇿🇦",
+    "NG": "🇳🇬",
+    "KE": "🇰🇪",
+    "ET": "🇪🇹",
+    "GH": "🇬🇭",
+    "TZ": "🇹🇿",
+    "UG": "🇺🇬",
+    "ZW": "🇿🇼",
+    "ZM": "🇿🇲",
+    "MW": "🇲🇼",
+    "MZ": "🇲🇿",
+    "BW": "🇧🇼",
+    "NA": "🇳🇦",
+    "AO": "🇦🇴",
+    "CD": "🇨🇩",
+    "CG": "🇨🇬",
+    "CM": "🇨🇲",
+    "CF": "🇨🇫",
+    "TD": "🇹🇩",
+    "NE": "🇳🇪",
+    "ML": "🇲🇱",
+    "BF": "🇧🇫",
+    "SN": "🇸🇳",
+    "GM": "🇬🇲",
+    "GN": "🇬🇳",
+    "SL": "🇸🇱",
+    "LR": "🇱🇷",
+    "CI": "🇨🇮",
+    "GW": "🇬🇼",
+    "CV": "🇨🇻",
+    "ST": "🇸🇹",
+    "GA": "🇬🇦",
+    "GQ": "🇬🇶",
+    "TG": "🇹🇬",
+    "BJ": "🇧🇯",
+    "BI": "🇧🇮",
+    "RW": "🇷🇼",
+    "DJ": "🇩🇯",
+    "SO": "🇸🇴",
+    "ER": "🇪🇷",
+    "SD": "🇸🇩",
+    "MG": "🇲🇬",
+    "KM": "🇰🇲",
+    "MU": "🇲🇺",
+    "SC": "🇸🇨",
+    "MV": "🇲🇻",
+    "MR": "🇲🇷",
+    "SZ": "🇸🇿",
+    "LS": "🇱🇸",
+    # Americas
+    "CO": "🇨🇴",
+    "VE": "🇻🇪",
+    "PE": "🇵🇪",
+    "CL": "🇨🇱",
+    "EC": "🇪🇨",
+    "BO": "🇧🇴",
+    "PY": "🇵🇾",
+    "UY": "🇺🇾",
+    "BS": "🇧🇸",
+    "BB": "🇧🇧",
+    "JM": "🇯🇲",
+    "TT": "🇹🇹",
+    "BZ": "🇧🇿",
+    "GT": "🇬🇹",
+    "HN": "🇭🇳",
+    "SV": "🇸🇻",
+    "NI": "🇳🇮",
+    "CR": "🇨🇷",
+    "PA": "🇵🇦",
+    "CU": "🇨🇺",
+    "DO": "🇩🇴",
+    "HT": "🇭🇹",
+    "GY": "🇬🇾",
+    "SR": "🇸🇷",
+    "AG": "🇦🇬",
+    "GD": "🇬🇩",
+    "VC": "🇻🇨",
+    # Pacific
+    "NZ": "🇳🇿",
+    "FJ": "🇫🇯",
+    "PG": "🇵🇬",
+    "SB": "🇸🇧",
+    "VU": "🇻🇺",
+    "NC": "🇳🇨",
+    "PF": "🇵🇫",
+    "WS": "🇼🇸",
+    "TO": "🇹🇴",
+    "KI": "🇰🇮",
+    "NR": "🇳🇷",
+    "MH": "🇲🇭",
+    "FM": "🇫🇲",
+    "PW": "🇵🇼",
+    "CK": "🇨🇰",
+    "LC": "🇱🇨",
+}
+
+
 def get_country_flag(country_code: str) -> str:
     """Get emoji flag for two-character country code"""
-    flag_mappings = {
-        # Major countries
-        "US": "🇺🇸",
-        "CA": "🇨🇦",
-        "MX": "🇲🇽",
-        "GB": "🇬🇧",
-        "FR": "🇫🇷",
-        "DE": "🇩🇪",
-        "IT": "🇮🇹",
-        "ES": "🇪🇸",
-        "RU": "🇷🇺",
-        "CN": "🇨🇳",
-        "JP": "🇯🇵",
-        "IN": "🇮🇳",
-        "AU": "🇦🇺",
-        "BR": "🇧🇷",
-        "AR": "🇦🇷",
-        # Europe
-        "AT": "🇦🇹",
-        "BE": "🇧🇪",
-        "BG": "🇧🇬",
-        "DK": "🇩🇰",
-        "FI": "🇫🇮",
-        "NL": "🇳🇱",
-        "NO": "🇳🇴",
-        "PL": "🇵🇱",
-        "PT": "🇵🇹",
-        "CZ": "🇨🇿",
-        "SE": "🇸🇪",
-        "CH": "🇨🇭",
-        "TR": "🇹🇷",
-        "RO": "🇷🇴",
-        "GR": "🇬🇷",
-        "HU": "🇭🇺",
-        "IE": "🇮🇪",
-        "IS": "🇮🇸",
-        "LU": "🇱🇺",
-        "MT": "🇲🇹",
-        "MC": "🇲🇨",
-        "CY": "🇨🇾",
-        "HR": "🇭🇷",
-        "SI": "🇸🇮",
-        "SK": "🇸🇰",
-        "LV": "🇱🇻",
-        "LT": "🇱🇹",
-        "EE": "🇪🇪",
-        "UA": "🇺🇦",
-        "BY": "🇧🇾",
-        "MD": "🇲🇩",
-        "AL": "🇦🇱",
-        "BA": "🇧🇦",
-        "MK": "🇲🇰",
-        "SM": "🇸🇲",
-        "YU": "🇷🇸",  # Yugoslavia (historical) - using Serbia flag
-        # Asia
-        "KR": "🇰🇷",
-        "KP": "🇰🇵",
-        "TH": "🇹🇭",
-        "VN": "🇻🇳",
-        "MY": "🇲🇾",
-        "SG": "🇸🇬",
-        "PH": "🇵🇭",
-        "ID": "🇮🇩",
-        "PK": "🇵🇰",
-        "BD": "🇧🇩",
-        "LK": "🇱🇰",
-        "MM": "🇲🇲",
-        "AF": "🇦🇫",
-        "IR": "🇮🇷",
-        "IQ": "🇮🇶",
-        "SA": "🇸🇦",
-        "AE": "🇦🇪",
-        "KW": "🇰🇼",
-        "QA": "🇶🇦",
-        "BH": "🇧🇭",
-        "OM": "🇴🇲",
-        "YE": "🇾🇪",
-        "JO": "🇯🇴",
-        "LB": "🇱🇧",
-        "SY": "🇸🇾",
-        "IL": "🇮🇱",
-        "TW": "🇹🇼",
-        "MN": "🇲🇳",
-        "KZ": "🇰🇿",
-        "UZ": "🇺🇿",
-        "KG": "🇰🇬",
-        "TJ": "🇹🇯",
-        "TM": "🇹🇲",
-        "AM": "🇦🇲",
-        "AZ": "🇦🇿",
-        "GE": "🇬🇪",
-        "LA": "🇱🇦",
-        "KH": "🇰🇭",
-        "BT": "🇧🇹",
-        "NP": "🇳🇵",
-        "BN": "🇧🇳",
-        # Africa
-        "EG": "🇪🇬",
-        "LY": "🇱🇾",
-        "MA": "🇲🇦",
-        "TN": "🇹🇳",
-        "DZ": "🇩🇿",
-        "ZA": "🇿🇦",
-        "NG": "🇳🇬",
-        "KE": "🇰🇪",
-        "ET": "🇪🇹",
-        "GH": "🇬🇭",
-        "TZ": "🇹🇿",
-        "UG": "🇺🇬",
-        "ZW": "🇿🇼",
-        "ZM": "🇿🇲",
-        "MW": "🇲🇼",
-        "MZ": "🇲🇿",
-        "BW": "🇧🇼",
-        "NA": "🇳🇦",
-        "AO": "🇦🇴",
-        "CD": "🇨🇩",
-        "CG": "🇨🇬",
-        "CM": "🇨🇲",
-        "CF": "🇨🇫",
-        "TD": "🇹🇩",
-        "NE": "🇳🇪",
-        "ML": "🇲🇱",
-        "BF": "🇧🇫",
-        "SN": "🇸🇳",
-        "GM": "🇬🇲",
-        "GN": "🇬🇳",
-        "SL": "🇸🇱",
-        "LR": "🇱🇷",
-        "CI": "🇨🇮",
-        "GW": "🇬🇼",
-        "CV": "🇨🇻",
-        "ST": "🇸🇹",
-        "GA": "🇬🇦",
-        "GQ": "🇬🇶",
-        "TG": "🇹🇬",
-        "BJ": "🇧🇯",
-        "BI": "🇧🇮",
-        "RW": "🇷🇼",
-        "DJ": "🇩🇯",
-        "SO": "🇸🇴",
-        "ER": "🇪🇷",
-        "SD": "🇸🇩",
-        "MG": "🇲🇬",
-        "KM": "🇰🇲",
-        "MU": "🇲🇺",
-        "SC": "🇸🇨",
-        "MV": "🇲🇻",
-        "MR": "🇲🇷",
-        "SZ": "🇸🇿",
-        "LS": "🇱🇸",
-        # Americas
-        "CO": "🇨🇴",
-        "VE": "🇻🇪",
-        "PE": "🇵🇪",
-        "CL": "🇨🇱",
-        "EC": "🇪🇨",
-        "BO": "🇧🇴",
-        "PY": "🇵🇾",
-        "UY": "🇺🇾",
-        "BS": "🇧🇸",
-        "BB": "🇧🇧",
-        "JM": "🇯🇲",
-        "TT": "🇹🇹",
-        "BZ": "🇧🇿",
-        "GT": "🇬🇹",
-        "HN": "🇭🇳",
-        "SV": "🇸🇻",
-        "NI": "🇳🇮",
-        "CR": "🇨🇷",
-        "PA": "🇵🇦",
-        "CU": "🇨🇺",
-        "DO": "🇩🇴",
-        "HT": "🇭🇹",
-        "GY": "🇬🇾",
-        "SR": "🇸🇷",
-        "AG": "🇦🇬",
-        "GD": "🇬🇩",
-        "VC": "🇻🇨",
-        # Pacific
-        "NZ": "🇳🇿",
-        "FJ": "🇫🇯",
-        "PG": "🇵🇬",
-        "SB": "🇸🇧",
-        "VU": "🇻🇺",
-        "NC": "🇳🇨",
-        "PF": "🇵🇫",
-        "WS": "🇼🇸",
-        "TO": "🇹🇴",
-        "KI": "🇰🇮",
-        "NR": "🇳🇷",
-        "MH": "🇲🇭",
-        "FM": "🇫🇲",
-        "PW": "🇵🇼",
-        "CK": "🇨🇰",
-        "LC": "🇱🇨",
-    }
-    return flag_mappings.get(country_code, "🏳️")  # Default to white flag for unknown
+    return FLAG_MAPPINGS.get(country_code, "🏳️")  # Default to white flag for unknown
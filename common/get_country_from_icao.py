@@ -1,3 +1,8 @@
+from functools import lru_cache
+
+
+# Pure function of the hex code, called for the same aircraft on every render
+@lru_cache(maxsize=4096)
 def get_country_from_icao(hex_code: str) -> str:
     """
     Get country code from ICAO hex code (official ICAO allocation)
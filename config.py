@@ -262,6 +262,18 @@ class PiPlaneTrackerConfig:
         """
         return self._get_str("monitor_aircraft_type", "all")
 
+    def get_position_history_limit(self) -> int:
+        """
+        Get the maximum number of positions kept per aircraft.
+
+        Older positions are discarded once the limit is reached so that
+        long-lived aircraft don't grow memory without bound.
+
+        Returns:
+            int: Maximum stored positions per aircraft (default: 600)
+        """
+        return self._get_int("monitor_position_history_limit", 600)
+
     # === DISPLAY CONFIGURATION METHODS ===
 
     def is_lcd_enabled(self) -> bool:
@@ -16,7 +16,6 @@ except ImportError:
 import os
 import sys
 import time
-from datetime import datetime
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from common.get_country_from_icao import get_country_from_icao
@@ -67,8 +66,12 @@ class PiPlaneLCDController:
         Args:
             aircraft (dict): Aircraft data
         """
-        flight = aircraft.get("flight", "").strip()
-        hex_code = aircraft.get("hex", "")
+        get = aircraft.get
+        flight = get("flight", "").strip()
+        hex_code = get("hex", "")
+        altitude = get("alt_baro") or get("alt_geom")
+        speed = get("gs")
+        aircraft_type = get("aircraft_type")
         country = get_country_from_icao(hex_code)
 
         if flight:
@@ -79,9 +82,6 @@ class PiPlaneLCDController:
         line1 += f" [{country}]" if country else ""
 
         # Display altitude and speed if available
-        altitude = aircraft.get("alt_baro") or aircraft.get("alt_geom")
-        speed = aircraft.get("gs")
-
         if altitude and speed:
             line2 = f"{altitude}ft {speed}kt"
         elif altitude:
@@ -94,8 +94,6 @@ class PiPlaneLCDController:
         self.display_text(line1, line2[:16])
         time.sleep(interval)
 
-        aircraft_type = aircraft.get("aircraft_type")
-
         if aircraft_type:
             self.display_text(line1, f"{aircraft_type[:16]}")
             time.sleep(interval)
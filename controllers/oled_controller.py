@@ -11,6 +11,9 @@ try:
     from adafruit_ssd1306 import SSD1306_I2C
     from PIL import Image, ImageDraw, ImageFont
 
+    # Pillow >= 9.1 moved transpose constants into the Image.Transpose enum
+    ROTATE_270 = getattr(Image, "Transpose", Image).ROTATE_270
+
     OLED_AVAILABLE = True
 except ImportError:
     OLED_AVAILABLE = False
@@ -21,13 +24,17 @@ except ImportError:
 import os
 import sys
 import time
-from datetime import datetime
 from config import get_config
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from common.get_country_from_icao import get_country_from_icao
 from common.get_country_name import get_country_name
 
+# 8x8 1-bit plane icon (one byte per row, MSB is the leftmost pixel), pasted
+# as a sprite so the hot path never falls back to a glyph lookup for "✈"
+PLANE_ICON = bytes((0x20, 0x30, 0x98, 0xFF, 0xFF, 0x98, 0x30, 0x20))
+PLANE_ICON_SIZE = (8, 8)
+
 
 class PiPlaneOLEDController:
     def __init__(self, width=None, height=None, i2c_address=None):
@@ -39,6 +46,8 @@ class PiPlaneOLEDController:
             height (int): Display height in pixels (uses config if None)
             i2c_address (int): I2C address of the display (uses config if None)
         """
+        self.display = None
+
         # Get configuration
         config = get_config()
 
@@ -63,6 +72,12 @@ class PiPlaneOLEDController:
                 # Create image for drawing
                 self.image = Image.new("1", (self.width, self.height))
                 self.draw = ImageDraw.Draw(self.image)
+                self.plane_icon = Image.frombytes("1", PLANE_ICON_SIZE, PLANE_ICON)
+
+                # Persistent SSD1306 framebuffer; byte 0 is the I2C data control
+                # byte so each frame goes out without building a new buffer
+                self._fb = bytearray(self.width * self.height // 8 + 1)
+                self._fb[0] = 0x40
 
                 # Try to load a font (fallback to default if not available)
                 try:
@@ -93,12 +108,57 @@ class PiPlaneOLEDController:
         self.draw.text((x, y), text, font=font, fill=255)
 
     def show_display(self):
-        """Update the physical display"""
-        if self.display:
-            # Clear the image
-            self.draw.rectangle((0, 0, self.width, self.height), outline=0, fill=0)
-            return True
-        return False
+        """
+        Clear the drawing buffer for a new frame
+
+        Returns:
+            bool: True if a physical display is attached and can be drawn to
+        """
+        if self.display is None:
+            return False
+
+        # Clear the image (paste fills the buffer in C, no polygon drawing)
+        self.image.paste(0)
+        return True
+
+    def _update_framebuffer(self):
+        """Copy the 1-bit drawing buffer into the framebuffer in page order"""
+        pages = self.height // 8
+        width = self.width
+        # After rotating, each image row is one display column packed so that
+        # the LSB of every byte is the top pixel of a page (pages come reversed)
+        columns = self.image.transpose(ROTATE_270).tobytes()
+        for page in range(pages):
+            start = 1 + page * width
+            self._fb[start : start + width] = columns[pages - 1 - page :: pages]
+
+    def _i2c_write_full(self):
+        """Send the framebuffer to the SSD1306 in a single data transfer"""
+        col_offset = (128 - self.width) // 2  # Narrow panels use centered columns
+        i2c_device = self.display.i2c_device
+
+        with i2c_device:
+            # Co=0, D/C=0: remaining bytes are commands (column/page window)
+            i2c_device.write(
+                bytes(
+                    (
+                        0x00,
+                        0x21,
+                        col_offset,
+                        col_offset + self.width - 1,
+                        0x22,
+                        0,
+                        self.height // 8 - 1,
+                    )
+                )
+            )
+            # Framebuffer already starts with the Co=0, D/C=1 data control byte
+            i2c_device.write(self._fb)
+
+    def _flush(self):
+        """Push the drawing buffer to the physical display"""
+        self._update_framebuffer()
+        self._i2c_write_full()
 
     def display_startup_message(self):
         """Display startup message"""
@@ -107,12 +167,9 @@ class PiPlaneOLEDController:
 
         self.draw_text("PiPlane Tracker", 0, 0, self.font_medium)
         self.draw_text("Initializing...", 0, 12, self.font_small)
-        self.draw_text(
-            f"v1.0 {datetime.now().strftime('%H:%M')}", 0, 22, self.font_small
-        )
+        self.draw_text(f"v1.0 {time.strftime('%H:%M')}", 0, 22, self.font_small)
 
-        self.display.image(self.image)
-        self.display.show()
+        self._flush()
         time.sleep(2)
 
     def display_idle_message(self):
@@ -123,8 +180,7 @@ class PiPlaneOLEDController:
         self.draw_text("PiPlane Tracker", 0, 0, self.font_medium)
         self.draw_text("Monitoring for new aircrafts...", 0, 12, self.font_small)
 
-        self.display.image(self.image)
-        self.display.show()
+        self._flush()
 
     def display_new_aircraft_detected(self, interval=2):
         """Display message when new aircraft is detected"""
@@ -134,8 +190,7 @@ class PiPlaneOLEDController:
         self.draw_text("PiPlaneTracker", 0, 0, self.font_medium)
         self.draw_text("New aircraft detected!", 0, 12, self.font_small)
 
-        self.display.image(self.image)
-        self.display.show()
+        self._flush()
         time.sleep(interval)
 
     def display_aircraft_info(self, aircraft, interval=2):
@@ -149,21 +204,20 @@ class PiPlaneOLEDController:
         if not self.show_display():
             return
 
-        flight = aircraft.get("flight", "").strip()
-        hex_code = aircraft.get("hex", "")
-        altitude = aircraft.get("alt_baro") or aircraft.get("alt_geom")
-        speed = aircraft.get("gs")
-        country_code = get_country_from_icao(hex_code)
-        country = get_country_name(country_code)
-        aircraft_type = aircraft.get("aircraft_type")
+        get = aircraft.get
+        flight = get("flight", "").strip()
+        hex_code = get("hex", "")
+        altitude = get("alt_baro") or get("alt_geom")
+        speed = get("gs")
+        aircraft_type = get("aircraft_type")
+        country = get_country_name(get_country_from_icao(hex_code))
 
         # Line 1: Flight/Callsign or ICAO with Aircraft Type aligned right
+        self.image.paste(self.plane_icon, (0, 1))
         if flight:
-            flight_text = f"✈ {flight}"
-            self.draw_text(flight_text, 0, 0, self.font_medium)
+            self.draw_text(flight, 11, 0, self.font_medium)
         else:
-            hex_text = f"✈ {hex_code[:8]}"
-            self.draw_text(hex_text, 0, 0, self.font_small)
+            self.draw_text(hex_code[:8], 11, 0, self.font_small)
 
         # Add aircraft type aligned to the right on the same line
         if aircraft_type:
@@ -188,8 +242,33 @@ class PiPlaneOLEDController:
         speed_x_pos = 128 - len(speed_text) * 6  # Approximate 6px per character
         self.draw_text(f"{speed_text}", speed_x_pos, 22, self.font_small)
 
-        self.display.image(self.image)
-        self.display.show()
+        self._flush()
+        time.sleep(interval)
+
+    def display_aircraft_list(self, aircrafts, interval=2):
+        """
+        Display a compact summary of several aircraft in a single frame
+
+        Args:
+            aircrafts (list): Aircraft data, one per 8px row
+        """
+        if not self.show_display():
+            return
+
+        for row, aircraft in enumerate(aircrafts[: self.height // 8]):
+            y = row * 8
+            flight = aircraft.get("flight", "").strip()
+            label = flight or aircraft.get("hex", "")[:8].upper()
+            altitude = aircraft.get("alt_baro") or aircraft.get("alt_geom")
+            alt_text = f"{altitude}ft" if altitude else "N/A"
+
+            self.draw_text(label[:10], 0, y, self.font_small)
+
+            # Calculate approximate x position for right alignment
+            alt_x_pos = self.width - len(alt_text) * 6  # Approximate 6px per character
+            self.draw_text(alt_text, alt_x_pos, y, self.font_small)
+
+        self._flush()
         time.sleep(interval)
 
     def display_error(self, error_msg):
@@ -212,8 +291,7 @@ class PiPlaneOLEDController:
         else:
             self.draw_text(error_msg, 0, 11, self.font_small)
 
-        self.display.image(self.image)
-        self.display.show()
+        self._flush()
 
     def cleanup(self):
         """Cleanup OLED resources"""
@@ -225,8 +303,7 @@ class PiPlaneOLEDController:
                 self.draw_text("PiPlane Tracker", 0, 5, self.font_medium)
                 self.draw_text("Shutting down...", 0, 20, self.font_small)
 
-                self.display.image(self.image)
-                self.display.show()
+                self._flush()
                 time.sleep(1)
                 self.clear_display()
             except Exception as e:
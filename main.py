@@ -27,10 +27,6 @@ import sys
 import signal
 import os
 
-from services.monitor_service import PiPlaneMonitorService
-from controllers.lcd_controller import PiPlaneLCDController
-from controllers.oled_controller import PiPlaneOLEDController
-
 try:
     import termios
     import tty
@@ -7,7 +7,8 @@ Individual service classes for each display type
 import time
 import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Set
+from collections import deque
+from typing import Deque, FrozenSet, List, Set
 from datetime import datetime
 
 import sys
@@ -22,11 +23,14 @@ class BaseDisplayService(ABC):
 
     def __init__(self, name: str):
         self.name = name
-        self.queue: List[dict] = []
-        self.queue_lock = threading.Lock()
+        self.queue: Deque[dict] = deque()
+        self._queued_hex: Set[str] = set()  # Hex codes currently waiting in queue
+        self.queue_lock = threading.Condition()  # Guards queue and _queued_hex
         self.exit_requested = False
         self.thread = None
-        self.aircraft_history: Dict[str, dict] = {}  # Will be set by monitor service
+        self._last_signature = None  # Fields of the aircraft currently on screen
+        # Immutable snapshot of tracked hex codes, swapped in by monitor service
+        self.known_hex_codes: FrozenSet[str] = frozenset()
 
     def start(self):
         """Start the display service thread"""
@@ -41,19 +45,35 @@ class BaseDisplayService(ABC):
 
     def stop(self):
         """Stop the display service thread"""
-        self.exit_requested = True
+        # Wake the display thread so it exits without waiting out its timeout
+        with self.queue_lock:
+            self.exit_requested = True
+            self.queue_lock.notify_all()
 
     def add_aircraft(self, aircraft: dict):
         """Add aircraft to the display queue"""
-        hex_code = aircraft.get("hex")
-        if not hex_code:
-            return
+        self.add_aircrafts([aircraft])
+
+    def add_aircrafts(self, aircrafts: List[dict]):
+        """
+        Add several aircraft to the display queue under a single lock
 
+        Every aircraft must carry a "hex" code; the monitor service only
+        forwards aircraft that do.
+        """
         with self.queue_lock:
-            # Check if aircraft is already in queue
-            existing_hex_codes = {a.get("hex") for a in self.queue if a.get("hex")}
-            if hex_code not in existing_hex_codes:
+            added = False
+            for aircraft in aircrafts:
+                hex_code = aircraft["hex"]
+                # Skip aircraft already in queue
+                if hex_code in self._queued_hex:
+                    continue
+                self._queued_hex.add(hex_code)
                 self.queue.append(aircraft)
+                added = True
+
+            if added:
+                self.queue_lock.notify()
 
     def remove_aircraft(self, removed_hex_codes: Set[str]):
         """Remove aircraft from queue when they're removed from history"""
@@ -61,49 +81,77 @@ class BaseDisplayService(ABC):
             return
 
         with self.queue_lock:
-            self.queue = [
+            self.queue = deque(
                 aircraft
                 for aircraft in self.queue
-                if aircraft.get("hex") not in removed_hex_codes
-            ]
+                if aircraft["hex"] not in removed_hex_codes
+            )
+            self._queued_hex -= removed_hex_codes
 
     def get_queue_length(self) -> int:
         """Get current queue length"""
+        # len() of a deque is atomic under the GIL; an approximate value is fine
+        return len(self.queue)
+
+    def _take_queued(self, count: int) -> List[dict]:
+        """Pop up to count still-tracked aircraft from the front of the queue"""
+        taken = []
         with self.queue_lock:
-            return len(self.queue)
+            while self.queue and len(taken) < count:
+                aircraft = self.queue.popleft()
+                hex_code = aircraft["hex"]
+                self._queued_hex.discard(hex_code)
+                if hex_code in self.known_hex_codes:
+                    taken.append(aircraft)
+        return taken
 
     def _display_loop(self):
         """Main display loop - runs continuously"""
         while not self.exit_requested:
             try:
-                with self.queue_lock:
-                    if not self.queue:
-                        aircraft = None
-                    else:
-                        aircraft = self.queue.pop(0)
-
-                if aircraft:
-                    # Check if aircraft is still in history
-                    hex_code = aircraft.get("hex")
-                    if (
-                        hex_code
-                        and self.aircraft_history
-                        and hex_code in self.aircraft_history
-                    ):
-                        self._process_aircraft(aircraft)
-                else:
-                    # No aircraft in queue, check if we should show idle message
-                    with self.queue_lock:
-                        queue_empty = len(self.queue) == 0
-
-                    if queue_empty:
-                        self._show_idle_message()
-
-                time.sleep(0.1)  # Brief sleep to prevent excessive CPU usage
+                self._display_step()
             except Exception as e:
                 print(f"Error in {self.name} display loop: {e}")
                 time.sleep(1)
 
+    def _display_step(self):
+        """Wait for the next queued aircraft and display it"""
+        # Block until an aircraft is queued instead of polling
+        with self.queue_lock:
+            if not self.queue and not self.exit_requested:
+                self.queue_lock.wait(timeout=1.0)
+
+            if self.exit_requested:
+                return
+
+            if self.queue:
+                aircraft = self.queue.popleft()
+                self._queued_hex.discard(aircraft["hex"])
+            else:
+                aircraft = None
+
+        if not aircraft:
+            # No aircraft in queue, show idle message
+            self._show_idle_message()
+            return
+
+        # Check if aircraft is still in history
+        if aircraft["hex"] in self.known_hex_codes:
+            self._process_aircraft(aircraft)
+
+    @staticmethod
+    def _aircraft_signature(aircraft: dict) -> tuple:
+        """Build a tuple of the fields that affect what is rendered"""
+        return (
+            aircraft["hex"],
+            aircraft.get("flight"),
+            aircraft.get("alt_baro") or aircraft.get("alt_geom"),
+            aircraft.get("gs"),
+            aircraft.get("track"),
+            aircraft.get("lat") is not None,
+            aircraft.get("aircraft_type"),
+        )
+
     @abstractmethod
     def _process_aircraft(self, aircraft: dict):
         """Process a single aircraft - implemented by subclasses"""
@@ -131,22 +179,34 @@ class LCDDisplayService(BaseDisplayService):
     def _process_aircraft(self, aircraft: dict):
         """Display aircraft information on LCD"""
         if self.lcd_controller:
+            # Skip the render if this exact aircraft is already on screen
+            signature = self._aircraft_signature(aircraft)
+            if signature == self._last_signature:
+                return
+
             self.lcd_controller.display_new_aircraft_detected(interval=2)
             self.lcd_controller.display_aircraft_info(
                 aircraft=aircraft, interval=self.update_interval
             )
             self._last_state = "aircraft"
+            self._last_signature = signature
 
     def _show_idle_message(self):
         """Show idle message on LCD if not already showing"""
         if self.lcd_controller and self._last_state != "idle":
             self.lcd_controller.display_idle_message()
             self._last_state = "idle"
+            self._last_signature = None
 
 
 class OLEDDisplayService(BaseDisplayService):
     """OLED display service for showing aircraft on OLED screen"""
 
+    # Once more than BATCH_THRESHOLD aircraft are waiting, show up to
+    # BATCH_SIZE of them on a single frame instead of one refresh each
+    BATCH_THRESHOLD = 3
+    BATCH_SIZE = 4
+
     def __init__(self, oled_controller):
         super().__init__("OLED")
         self.oled_controller = oled_controller
@@ -161,14 +221,31 @@ class OLEDDisplayService(BaseDisplayService):
     def _process_aircraft(self, aircraft: dict):
         """Display aircraft information on OLED"""
         if self.oled_controller:
+            if self.get_queue_length() > self.BATCH_THRESHOLD:
+                batch = [aircraft] + self._take_queued(self.BATCH_SIZE - 1)
+                self.oled_controller.display_new_aircraft_detected(interval=2)
+                self.oled_controller.display_aircraft_list(
+                    aircrafts=batch, interval=self.update_interval
+                )
+                self._last_state = "aircraft"
+                self._last_signature = None
+                return
+
+            # Skip the render if this exact aircraft is already on screen
+            signature = self._aircraft_signature(aircraft)
+            if signature == self._last_signature:
+                return
+
             self.oled_controller.display_new_aircraft_detected(interval=2)
             self.oled_controller.display_aircraft_info(
                 aircraft=aircraft, interval=self.update_interval
             )
             self._last_state = "aircraft"
+            self._last_signature = signature
 
     def _show_idle_message(self):
         """Show idle message on OLED if not already showing"""
         if self.oled_controller and self._last_state != "idle":
             self.oled_controller.display_idle_message()
             self._last_state = "idle"
+            self._last_signature = None
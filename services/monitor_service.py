@@ -5,12 +5,28 @@ Tracks new airplanes entering range and provides alerts
 """
 
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Dict, List, Optional
 import threading
 import json
 import os
 
+try:
+    # orjson parses several times faster; its JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
 from apis.hexdb_api import enhance_aircraft_data, get_hexdb_api
 from config import get_config
 from .display_services import (
@@ -21,6 +37,25 @@ from .sound_alert_service import PiPlaneSoundAlertService
 from .visualization_service import PiPlaneVisualizationService
 
 
+class AircraftFileEventHandler(FileSystemEventHandler):
+    """Signals the monitor loop whenever the aircraft data file is rewritten"""
+
+    def __init__(self, file_path: str, data_changed: threading.Event):
+        super().__init__()
+        self.file_path = os.path.abspath(file_path)
+        self.data_changed = data_changed
+
+    def on_closed(self, event):
+        # Fires once per finished write, not on every partial write
+        if event.src_path == self.file_path:
+            self.data_changed.set()
+
+    def on_moved(self, event):
+        # dump1090-fa replaces aircraft.json atomically via rename
+        if event.dest_path == self.file_path:
+            self.data_changed.set()
+
+
 class PiPlaneMonitorService:
     def __init__(
         self,
@@ -40,13 +75,15 @@ class PiPlaneMonitorService:
             oled_controller: OLED controller instance (optional)
             enable_visualization (bool): Whether to enable the interactive visualization service
         """
-        self.aircraft_history: Dict[str, dict] = {}
+        # Kept in last_seen order: every update moves the entry to the end
+        self.aircraft_history: Dict[str, dict] = OrderedDict()
         self.running = False
         self.enable_visualization = enable_visualization
 
         config = get_config()
 
         self.monitor_aircraft_type = config.get_monitor_aircraft_type()
+        self.position_history_limit = config.get_position_history_limit()
         self.is_hexdb_enabled = config.is_hexdb_enabled()
 
         # Initialize HexDB API with configuration values if enabled
@@ -58,6 +95,12 @@ class PiPlaneMonitorService:
 
         # Set up data source path
         self.file_path = config.get_data_source_path()
+        # Descriptor kept open across ticks, reopened when the inode changes
+        self._fd = None
+        self._fd_ino = None
+        # Last parsed data and the mtime it was read at
+        self._last_mtime_ns = 0
+        self._last_data = None
 
         # Initialize display services
         self.lcd_service = None
@@ -68,6 +111,11 @@ class PiPlaneMonitorService:
         if oled_controller:
             self.oled_service = OLEDDisplayService(oled_controller)
 
+        # Active display services, fixed for the lifetime of the monitor
+        self._display_services = [
+            service for service in (self.lcd_service, self.oled_service) if service
+        ]
+
         # Initialize visualization service for interactive console (optional)
         self.visualization_service = None
         if enable_visualization:
@@ -86,41 +134,27 @@ class PiPlaneMonitorService:
             print(f"⚠️  Sound alert service initialization failed: {e}")
             self.sound_alert_service = None
 
-        # Set aircraft history reference for all services
-        if self.lcd_service:
-            self.lcd_service.aircraft_history = self.aircraft_history
-        if self.oled_service:
-            self.oled_service.aircraft_history = self.aircraft_history
+        # Set aircraft history reference for the visualization service
         if self.visualization_service:
             self.visualization_service.update_aircraft_history(self.aircraft_history)
 
         # Keyboard input handling
         self.exit_requested = False
 
+        # Set by the file watcher when new aircraft data is written
+        self._data_changed = threading.Event()
+        self._observer = None
+
         # Start display services
         self._start_display_services()
 
     def _start_display_services(self):
         """Start all display services"""
-        if self.lcd_service:
-            self.lcd_service.start()
-
-        if self.oled_service:
-            self.oled_service.start()
+        for service in self._display_services:
+            service.start()
 
         # Visualization service will be started in main monitoring loop
 
-    def _is_valid_aircraft(self, aircraft: dict) -> bool:
-        """Check if the aircraft data is valid"""
-        if self.monitor_aircraft_type == "all":
-            return True
-
-        if self.monitor_aircraft_type == "registered":
-            flight = aircraft.get("flight", "").strip()
-            return bool(flight)
-
-        return True
-
     def _read_aircraft_data(self) -> Optional[Dict]:
         """
         Read aircraft data from the dump1090-fa JSON file
@@ -129,15 +163,35 @@ class PiPlaneMonitorService:
             dict: Aircraft data or None if file cannot be read
         """
         try:
-            if not os.path.exists(self.file_path):
+            # dump1090-fa replaces the file by rename, so a new inode means new file
+            try:
+                st = os.stat(self.file_path)
+            except FileNotFoundError:
                 print(f"Error: Aircraft data file not found at {self.file_path}")
                 print("Make sure dump1090-fa is running and the file path is correct.")
                 print("You can change the file path in the 'config' file")
                 return None
 
-            with open(self.file_path, "r") as file:
-                data = json.load(file)
-                return data
+            # Unchanged since the last parse: reuse it instead of reading again
+            inode = st.st_ino
+            if (
+                self._last_data is not None
+                and inode == self._fd_ino
+                and st.st_mtime_ns == self._last_mtime_ns
+            ):
+                return self._last_data
+
+            if self._fd is None or inode != self._fd_ino:
+                self._close_data_file()
+                self._fd = os.open(self.file_path, os.O_RDONLY)
+                self._fd_ino = os.fstat(self._fd).st_ino
+
+            # Read raw bytes; both parsers decode UTF-8 themselves
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            data = json_loads(os.read(self._fd, os.fstat(self._fd).st_size))
+            self._last_mtime_ns = st.st_mtime_ns
+            self._last_data = data
+            return data
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON format in {self.file_path}: {e}")
             return None
@@ -148,104 +202,29 @@ class PiPlaneMonitorService:
             print(f"Error reading aircraft data: {e}")
             return None
 
-    def _cleanup_old_aircrafts(self, current_aircrafts: List[dict]):
-        """Remove aircrafts that haven't been seen for 5 minutes"""
-        current_time = datetime.now()
-        aircrafts_to_remove = []
-
-        current_hex_codes = {
-            aircraft.get("hex") for aircraft in current_aircrafts if aircraft.get("hex")
-        }
-
-        # Use list() to create a copy of keys to avoid modification during iteration
-        for hex_code in list(self.aircraft_history.keys()):
-            if hex_code not in current_hex_codes:
-                aircrafts_to_remove.append(hex_code)
+    def _close_data_file(self):
+        """Close the held aircraft data file descriptor, if any"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._fd_ino = None
+
+    def _cleanup_old_aircrafts(self, now_monotonic: float):
+        """Remove aircrafts that are no longer in the current data set"""
+        # Every aircraft seen this tick was stamped with now_monotonic and moved
+        # to the end, so the stale ones are the run before the first such stamp
+        aircrafts_to_remove = set()
+        for hex_code, info in self.aircraft_history.items():
+            if info["last_seen_monotonic"] == now_monotonic:
+                break
+            aircrafts_to_remove.add(hex_code)
 
         for hex_code in aircrafts_to_remove:
             del self.aircraft_history[hex_code]
 
         # Clean up queues for removed aircraft
         if aircrafts_to_remove:
-            self._cleanup_queues_for_removed_aircraft(set(aircrafts_to_remove))
-
-    def _create_aircraft_info(self, aircraft: dict):
-        hex_code = aircraft.get("hex")
-
-        if not hex_code:
-            return
-
-        # Enhance aircraft data with HexDB if enabled
-        enhanced_aircraft = aircraft
-        if self.is_hexdb_enabled:
-            enhanced_aircraft = enhance_aircraft_data(aircraft)
-
-        self.aircraft_history[hex_code] = {
-            "first_seen": datetime.now(),
-            "last_seen": datetime.now(),
-            "flight": enhanced_aircraft.get("flight", "").strip(),
-            "altitude": enhanced_aircraft.get("alt_baro"),
-            "speed": enhanced_aircraft.get("gs"),
-            "positions": [],
-            # Add HexDB enhanced fields
-            "aircraft_type": enhanced_aircraft.get("aircraft_type"),
-            "manufacturer": enhanced_aircraft.get("manufacturer"),
-            "registration": enhanced_aircraft.get("registration"),
-            "operator": enhanced_aircraft.get("operator"),
-        }
-
-        if aircraft.get("lat") and aircraft.get("lon"):
-            self.aircraft_history[hex_code]["positions"].append(
-                {
-                    "lat": aircraft["lat"],
-                    "lon": aircraft["lon"],
-                    "timestamp": datetime.now(),
-                }
-            )
-
-    def _update_aircraft_info(self, aircraft: dict):
-        """Update aircraft information in the history"""
-        hex_code = aircraft.get("hex")
-
-        if not hex_code:
-            return
-
-        if hex_code in self.aircraft_history:
-            self.aircraft_history[hex_code]["last_seen"] = datetime.now()
-
-            # Update dynamic fields that may change
-            if aircraft.get("alt_baro") is not None:
-                self.aircraft_history[hex_code]["altitude"] = aircraft.get("alt_baro")
-            if aircraft.get("gs") is not None:
-                self.aircraft_history[hex_code]["speed"] = aircraft.get("gs")
-            if aircraft.get("flight") is not None:
-                self.aircraft_history[hex_code]["flight"] = aircraft.get("flight")
-
-            # Update HexDB enhanced fields if available
-            if self.is_hexdb_enabled:
-                enhanced_aircraft = enhance_aircraft_data(aircraft)
-                self.aircraft_history[hex_code].update(
-                    {
-                        "aircraft_type": enhanced_aircraft.get("aircraft_type"),
-                        "manufacturer": enhanced_aircraft.get("manufacturer"),
-                        "registration": enhanced_aircraft.get("registration"),
-                        "operator": enhanced_aircraft.get("operator"),
-                    }
-                )
-
-            # Update position history
-            if hex_code not in self.aircraft_history:
-                self.aircraft_history[hex_code] = {"positions": []}
-
-            # Add position if available
-            if aircraft.get("lat") and aircraft.get("lon"):
-                self.aircraft_history[hex_code]["positions"].append(
-                    {
-                        "lat": aircraft["lat"],
-                        "lon": aircraft["lon"],
-                        "timestamp": datetime.now(),
-                    }
-                )
+            self._cleanup_queues_for_removed_aircraft(aircrafts_to_remove)
 
     def _get_new_and_existing_aircrafts(
         self, aircraft_data: dict
@@ -253,6 +232,9 @@ class PiPlaneMonitorService:
         """
         Get new and existing aircrafts from the data
 
+        Aircraft without a hex code are dropped here, so every returned
+        aircraft can be indexed with aircraft["hex"] directly.
+
         Args:
             aircraft_data (dict): Aircraft data from dump1090-fa
 
@@ -265,88 +247,197 @@ class PiPlaneMonitorService:
         new_aircrafts = []
         existing_aircrafts = []
 
+        # Local bindings keep attribute lookups out of the per-aircraft loop
+        history = self.aircraft_history
+        new_append = new_aircrafts.append
+        existing_append = existing_aircrafts.append
+        require_flight = self.monitor_aircraft_type == "registered"
+
         for aircraft in aircraft_data["aircraft"]:
             hex_code = aircraft.get("hex")
-
             if not hex_code:
                 continue
 
-            if not self._is_valid_aircraft(aircraft):
+            # Tracked aircraft were already validated when first seen
+            if hex_code in history:
+                existing_append(aircraft)
                 continue
 
-            if hex_code in self.aircraft_history:
-                existing_aircrafts.append(aircraft)
-            else:
-                new_aircrafts.append(aircraft)
+            # Registered aircraft must broadcast a flight identifier
+            if require_flight:
+                flight = aircraft.get("flight")
+                # isspace() tests blankness without allocating a stripped copy
+                if not flight or flight.isspace():
+                    continue
+
+            new_append(aircraft)
 
         return new_aircrafts, existing_aircrafts
 
     def _update_aircraft_history(
-        self, new_aircrafts: List[dict], existing_aircrafts: List[dict]
+        self,
+        new_aircrafts: List[dict],
+        existing_aircrafts: List[dict],
+        now: datetime,
     ):
+        """Create, refresh and expire aircraft history records for one tick"""
+        now_monotonic = time.monotonic()
+
+        # Per-aircraft work is inlined here; these run for every aircraft each tick
+        history = self.aircraft_history
+        hexdb_enabled = self.is_hexdb_enabled
+        position_history_limit = self.position_history_limit
+
         for aircraft in new_aircrafts:
-            self._create_aircraft_info(aircraft)
+            # Enhance aircraft data with HexDB if enabled
+            enhanced_aircraft = aircraft
+            if hexdb_enabled:
+                enhanced_aircraft = enhance_aircraft_data(aircraft)
+
+            info = {
+                "first_seen": now,
+                "last_seen": now,
+                # Tick stamp; entries without the current one are expired
+                "last_seen_monotonic": now_monotonic,
+                "flight": enhanced_aircraft.get("flight", "").strip(),
+                "altitude": enhanced_aircraft.get("alt_baro"),
+                "speed": enhanced_aircraft.get("gs"),
+                # (lat, lon, timestamp) tuples, oldest evicted first
+                "positions": deque(maxlen=position_history_limit),
+                # Add HexDB enhanced fields
+                "aircraft_type": enhanced_aircraft.get("aircraft_type"),
+                "manufacturer": enhanced_aircraft.get("manufacturer"),
+                "registration": enhanced_aircraft.get("registration"),
+                "operator": enhanced_aircraft.get("operator"),
+            }
+
+            lat, lon = aircraft.get("lat"), aircraft.get("lon")
+            if lat is not None and lon is not None:
+                info["positions"].append((lat, lon, now))
+
+            history[aircraft["hex"]] = info
 
         for aircraft in existing_aircrafts:
-            self._update_aircraft_info(aircraft)
+            hex_code = aircraft["hex"]
+            info = history[hex_code]
+            history.move_to_end(hex_code)
+            info["last_seen"] = now
+            info["last_seen_monotonic"] = now_monotonic
+
+            # Update dynamic fields that may change
+            altitude = aircraft.get("alt_baro")
+            if altitude is not None:
+                info["altitude"] = altitude
+            speed = aircraft.get("gs")
+            if speed is not None:
+                info["speed"] = speed
+            flight = aircraft.get("flight")
+            if flight is not None:
+                info["flight"] = flight
+
+            # Update HexDB enhanced fields if available
+            if hexdb_enabled:
+                enhanced_aircraft = enhance_aircraft_data(aircraft)
+                info.update(
+                    {
+                        "aircraft_type": enhanced_aircraft.get("aircraft_type"),
+                        "manufacturer": enhanced_aircraft.get("manufacturer"),
+                        "registration": enhanced_aircraft.get("registration"),
+                        "operator": enhanced_aircraft.get("operator"),
+                    }
+                )
+
+            # Add position if available
+            lat, lon = aircraft.get("lat"), aircraft.get("lon")
+            if lat is not None and lon is not None:
+                info["positions"].append((lat, lon, now))
 
-        all_current_aircrafts = new_aircrafts + existing_aircrafts
-        self._cleanup_old_aircrafts(all_current_aircrafts)
+        self._cleanup_old_aircrafts(now_monotonic)
+
+        # Display threads only need membership checks, so publish an immutable
+        # snapshot instead of sharing the dict this thread keeps mutating
+        known_hex_codes = frozenset(history)
+        for service in self._display_services:
+            service.known_hex_codes = known_hex_codes
+
+        # The render thread compares this counter instead of walking history
+        if self.visualization_service:
+            self.visualization_service.history_version += 1
 
     def _update_new_aircrafts_queue(self, new_aircrafts: List[dict]):
         """Distribute new aircrafts to all display services"""
-        if not new_aircrafts:
+        if not new_aircrafts or not self._display_services:
             return
 
+        history = self.aircraft_history
+        enhanced_aircrafts = []
         for aircraft in new_aircrafts:
-            hex_code = aircraft.get("hex")
-            if not hex_code:
-                continue
+            # New aircraft were just added to history, which holds the HexDB data
+            history_entry = history[aircraft["hex"]]
 
-            # Get enhanced aircraft data from history (includes HexDB data)
+            # Merge HexDB enhanced fields into aircraft data
             enhanced_aircraft = aircraft.copy()
-            if hex_code in self.aircraft_history:
-                history_entry = self.aircraft_history[hex_code]
-                # Merge HexDB enhanced fields into aircraft data
-                enhanced_aircraft.update(
-                    {
-                        "aircraft_type": history_entry.get("aircraft_type"),
-                        "manufacturer": history_entry.get("manufacturer"),
-                        "registration": history_entry.get("registration"),
-                        "operator": history_entry.get("operator"),
-                    }
-                )
-
-            # Add to all active display services
-            if self.lcd_service:
-                self.lcd_service.add_aircraft(enhanced_aircraft)
+            enhanced_aircraft.update(
+                {
+                    "aircraft_type": history_entry.get("aircraft_type"),
+                    "manufacturer": history_entry.get("manufacturer"),
+                    "registration": history_entry.get("registration"),
+                    "operator": history_entry.get("operator"),
+                }
+            )
+            enhanced_aircrafts.append(enhanced_aircraft)
 
-            if self.oled_service:
-                self.oled_service.add_aircraft(enhanced_aircraft)
+        # Hand the whole batch to each active display service at once
+        for service in self._display_services:
+            service.add_aircrafts(enhanced_aircrafts)
 
     def _cleanup_queues_for_removed_aircraft(self, removed_hex_codes: set):
         """Remove aircraft from all display service queues when they're removed from history"""
         if not removed_hex_codes:
             return
 
-        if self.lcd_service:
-            self.lcd_service.remove_aircraft(removed_hex_codes)
-
-        if self.oled_service:
-            self.oled_service.remove_aircraft(removed_hex_codes)
+        for service in self._display_services:
+            service.remove_aircraft(removed_hex_codes)
 
         if self.visualization_service:
             self.visualization_service.remove_aircraft(removed_hex_codes)
 
+    def _start_file_watcher(self):
+        """Watch the data file so the monitor loop wakes as soon as it changes"""
+        if not WATCHDOG_AVAILABLE:
+            return
+
+        watch_dir = os.path.dirname(os.path.abspath(self.file_path))
+        try:
+            self._observer = Observer()
+            self._observer.schedule(
+                AircraftFileEventHandler(self.file_path, self._data_changed),
+                watch_dir,
+            )
+            self._observer.daemon = True
+            self._observer.start()
+        except Exception as e:
+            print(f"⚠️  File watcher unavailable, polling instead: {e}")
+            self._observer = None
+
+    def _stop_file_watcher(self):
+        """Stop the data file watcher and wake the monitor loop"""
+        self._data_changed.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer = None
+
     def start_monitoring(self, interval=1):
         """
         Start monitoring for new aircraft and updating displays
 
         Args:
-            interval (int): Update interval in seconds for all components
+            interval (int): Maximum seconds between updates; when the file
+                watcher is available updates happen as soon as data changes
         """
         self.running = True
         self.exit_requested = False
+        self._start_file_watcher()
 
         def monitor_loop():
             print(
@@ -354,51 +445,57 @@ class PiPlaneMonitorService:
             )
 
             while self.running and not self.exit_requested:
+                # Clear before reading so a write during this tick wakes the next
+                self._data_changed.clear()
                 aircraft_data = self._read_aircraft_data()
 
                 if aircraft_data:
+                    # One timestamp for every record touched during this tick
+                    now = datetime.now()
+
                     # Get new and existing aircrafts from current data set
                     new_aircrafts, existing_aircrafts = (
                         self._get_new_and_existing_aircrafts(aircraft_data)
                     )
 
+                    # Hex codes are guaranteed present by the split above
+                    new_hex_codes = {aircraft["hex"] for aircraft in new_aircrafts}
+
                     # Add new aircrafts, update position, and remove old aircrafts from history
-                    self._update_aircraft_history(new_aircrafts, existing_aircrafts)
+                    self._update_aircraft_history(
+                        new_aircrafts, existing_aircrafts, now
+                    )
 
                     # Push new aircrafts to all display queues
                     self._update_new_aircrafts_queue(new_aircrafts)
 
                     # Log new aircraft detections
-                    if len(new_aircrafts) > 0:
+                    if new_hex_codes:
                         # Mark new aircraft in visualization service if enabled
                         if self.visualization_service:
-                            for aircraft in new_aircrafts:
-                                hex_code = aircraft.get("hex")
-                                if hex_code:
-                                    self.visualization_service.add_new_aircraft(
-                                        hex_code
-                                    )
+                            self.visualization_service.add_new_aircrafts(new_hex_codes)
 
                         # Trigger sound alert for new aircraft
                         if self.sound_alert_service:
                             self.sound_alert_service.play_aircraft_alert()
 
-                    time.sleep(interval)
+                # Wake as soon as the data file changes, or after interval
+                self._data_changed.wait(timeout=interval)
 
-        monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
-        monitor_thread.start()
-
-        # Start the visualization service if enabled (this will block until user quits)
         if self.visualization_service:
+            # The console blocks on user input, so monitor on a background thread
+            monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
+            monitor_thread.start()
+
+            # Start the visualization service (this will block until user quits)
             self.visualization_service.start()
             # When visualization stops, stop monitoring
             self.running = False
             self.exit_requested = True
         else:
-            # If no visualization service, just wait for the monitor thread
+            # Nothing else needs this thread, so run the monitor loop on it
             try:
-                while self.running and not self.exit_requested:
-                    time.sleep(1)
+                monitor_loop()
             except KeyboardInterrupt:
                 self.running = False
                 self.exit_requested = True
@@ -408,21 +505,20 @@ class PiPlaneMonitorService:
     def request_exit(self):
         """Request monitoring to stop (called externally)"""
         self.exit_requested = True
+        self._stop_file_watcher()
         self._stop_display_services()
 
     def stop_monitoring(self):
         """Stop monitoring"""
         self.running = False
         self.exit_requested = True
+        self._stop_file_watcher()
         self._stop_display_services()
 
     def _stop_display_services(self):
         """Stop all display services"""
-        if self.lcd_service:
-            self.lcd_service.stop()
-
-        if self.oled_service:
-            self.oled_service.stop()
+        for service in self._display_services:
+            service.stop()
 
         # Stop visualization service if enabled
         if self.visualization_service:
@@ -431,5 +527,6 @@ class PiPlaneMonitorService:
     def cleanup(self):
         """Cleanup all services"""
         self.stop_monitoring()
+        self._close_data_file()
         if self.visualization_service:
             self.visualization_service.cleanup()
@@ -4,11 +4,11 @@ Sound Alert Service for PiPlane Tracker
 Provides audio alerts when new aircraft are detected
 """
 
+import atexit
 import os
 import subprocess
 import threading
 import time
-from datetime import datetime
 from gpiozero import DigitalOutputDevice
 from time import sleep
 
@@ -45,6 +45,10 @@ class PiPlaneSoundAlertService:
                 "❌ Could not find mpg123. Please install it to use audio alerts."
             )
 
+        # The alert file is fixed, so check it once here rather than per alert
+        if alert_type == "mp3" and not os.path.isfile(audio_file_path):
+            raise FileNotFoundError(f"❌ Audio file not found: {audio_file_path}")
+
         self.alert_cooldown = alert_cooldown
         self.audio_file_path = audio_file_path
         self.volume = volume
@@ -53,6 +57,12 @@ class PiPlaneSoundAlertService:
 
         self.buzzer = DigitalOutputDevice(17)
 
+        # Long-lived mpg123 in remote-control mode, fed one LOAD per alert
+        self._player = None
+        if self.alert_type == "mp3":
+            self._start_player()
+            atexit.register(self._stop_player)
+
     def _can_play_alert(self) -> bool:
         """Check if enough time has passed since last alert (cooldown)"""
         current_time = time.time()
@@ -67,15 +77,53 @@ class PiPlaneSoundAlertService:
             sleep(0.1)
             self.buzzer.off()
 
+    def _buzzer_thread(self):
+        """Pulse the buzzer, reporting any failure"""
+        try:
+            self._play_buzzer()
+        except Exception as e:
+            print(f"Error pulsing buzzer: {e}")
+
+    def _start_player(self):
+        """Start the persistent mpg123 player process"""
+        self._player = subprocess.Popen(
+            ["mpg123", "-R", "-q"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+
+    def _stop_player(self):
+        """Ask the mpg123 player process to quit"""
+        if self._player and self._player.poll() is None:
+            try:
+                self._player.stdin.write(b"QUIT\n")
+                self._player.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._player.kill()
+        self._player = None
+
     def _play_mp3(self, file_path: str) -> bool:
         """Play MP3 file with mpg123"""
-        subprocess.run(
-            ["mpg123", "-q", file_path],
-            check=True,
-            capture_output=True,
-            timeout=10,
-        )
-        return True
+        command = f"LOAD {file_path}\n".encode()
+
+        # Restart the player if it has exited since the last alert
+        if self._player is None or self._player.poll() is not None:
+            self._start_player()
+
+        try:
+            self._player.stdin.write(command)
+        except BrokenPipeError:
+            # The player died after the poll() above; restart it and retry once
+            self._start_player()
+            try:
+                self._player.stdin.write(command)
+            except BrokenPipeError:
+                return False
+
+        # A player that quit at once (bad device, missing codec) played nothing
+        return self._player.poll() is None
 
     def _play_alert(self, file_path: str):
         """
@@ -84,27 +132,19 @@ class PiPlaneSoundAlertService:
         Args:
             file_path (str): Path to audio file
         """
-        if not os.path.exists(file_path):
-            print(f"Audio file not found: {file_path}")
-            return
-
-        def audio_thread():
+        if self.alert_type == "buzzer":
+            # The buzzer pulse sleeps, so keep it off the caller's thread
+            thread = threading.Thread(target=self._buzzer_thread, daemon=True)
+            thread.start()
+        elif self.alert_type == "mp3":
+            # Writing to the player's pipe returns immediately
             try:
-                if self.alert_type == "buzzer":
-                    self._play_buzzer()
-                elif self.alert_type == "mp3":
-                    if not self._play_mp3(file_path):
-                        print(f"Failed to play MP3 file: {file_path}")
-                        return
-                else:
-                    print(f"Unknown alert type: {self.alert_type}")
-                    return
-
+                if not self._play_mp3(file_path):
+                    print(f"Failed to play MP3 file: {file_path}")
             except Exception as e:
                 print(f"Error playing audio file: {e}")
-
-        thread = threading.Thread(target=audio_thread, daemon=True)
-        thread.start()
+        else:
+            print(f"Unknown alert type: {self.alert_type}")
 
     def play_aircraft_alert(self):
         """
@@ -116,6 +156,4 @@ class PiPlaneSoundAlertService:
 
         self.last_alert_time = time.time()
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
         self._play_alert(self.audio_file_path)
@@ -4,12 +4,16 @@ Console Visualization Service for PiPlane Tracker
 Provides simple console interface for aircraft monitoring
 """
 
+import bisect
 import os
+import shutil
 import sys
 import time
 import select
+import unicodedata
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from config import get_config
 
@@ -17,6 +21,81 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from common.get_country_from_icao import get_country_from_icao
 from common.get_country_flag import get_country_flag
 
+# Screen control sequence and separators shared by every frame
+_CLEAR = "\033[H\033[J"  # Move cursor home and erase to the end of the screen
+_CLEAR_BYTES = _CLEAR.encode()
+_SEP_EQ = "=" * 76
+_SEP_DASH = "-" * 76
+
+# Static frame sections, built once and copied into every frame
+_LIST_HEADER = (_SEP_EQ, "🛩️  PiPlane Tracker v1.0", _SEP_EQ, "")
+_LIST_DIVIDER = ("", _SEP_DASH)
+_LIST_FOOTER = (
+    "",
+    "  [Enter] Refresh",
+    "  [1] Aircraft Details",
+    "  [Q] Quit",
+    _SEP_EQ,
+    ">>> ",
+)
+_DETAIL_HEADER = ("🛩️  PiPlane Tracker - Aircraft Details", _SEP_EQ, "")
+_DETAIL_FOOTER = ("", _SEP_DASH, "[ENTER] Return to aircraft list", ">>> ")
+
+MAX_LIST_ROWS = 15  # Aircraft shown in the list view
+REFRESH_DEBOUNCE = 0.05  # Seconds to wait so bursts of updates render once
+_ROW_PREFIXES = [f"{n:2d}. " for n in range(1, MAX_LIST_ROWS + 1)]
+
+
+# Rows repeat from frame to frame, so measure each distinct one once
+@lru_cache(maxsize=1024)
+def _display_width(text: str) -> int:
+    """Count the terminal columns text takes, with wide characters and emoji as two"""
+    if text.isascii():
+        return len(text)
+    width = 0
+    for ch in text:
+        if ch == "\ufe0f":
+            # Emoji presentation widens the preceding narrow symbol (✈️, 🛩️)
+            width += 1
+        elif ch == "\u200d" or unicodedata.combining(ch):
+            continue
+        elif unicodedata.east_asian_width(ch) in ("W", "F"):
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+# The same few timestamps are shown on every frame; format each one once
+@lru_cache(maxsize=1024)
+def _format_hms(dt: datetime) -> str:
+    """Format a datetime as HH:MM:SS"""
+    # Plain integer formatting skips strftime's locale-aware machinery
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+@lru_cache(maxsize=1024)
+def _format_datetime(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM:SS"""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
+# Altitudes and speeds repeat across aircraft and frames; typed=True keeps
+# 450 and 450.0 apart since they format differently
+@lru_cache(maxsize=4096, typed=True)
+def _format_altitude(altitude) -> str:
+    """Format a list-view altitude in feet with thousands separators"""
+    return f"{altitude:,}ft" if altitude is not None else "N/A"
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _format_speed(speed) -> str:
+    """Format a list-view ground speed in knots"""
+    return f"{speed}kt" if speed is not None else "N/A"
+
 
 class PiPlaneVisualizationService:
     """
@@ -32,156 +111,274 @@ class PiPlaneVisualizationService:
     def __init__(self):
         """Initialize the visualization service"""
         self.aircraft_history: Dict[str, dict] = {}
+        # Bumped by the monitor after every history update, so the render
+        # thread can spot changes without iterating the monitor's dict
+        self.history_version = 0
         self.running = False
-        self.thread = None
         self.current_view = "list"  # "list" or "detail"
         self.selected_aircraft_hex = None
-        self.new_aircraft_tags: Dict[str, datetime] = {}  # Track [NEW] tags
+        # Track [NEW] tags as hex code -> time.monotonic() expiry deadline
+        self.new_aircraft_tags: Dict[str, float] = {}
         self.new_tag_duration = 30  # seconds to show [NEW] tag
-        self.last_render_time = 0
+        self.last_render_time = 0.0  # time.monotonic() of the last render
         self.render_interval = 2.0  # Render every 2 seconds for auto-refresh
-        self.auto_refresh_needed = False  # Flag to trigger immediate refresh
+        # Monotonic deadline of a requested refresh (inf when none is pending)
+        self._refresh_at = float("inf")
+        self._prev_lines: List[str] = []  # Last drawn frame, empty forces a full redraw
+        # Tracked hex codes in display order; replaced, never mutated, so the
+        # render loop can read it while the monitor thread updates it
+        self._sorted_hex: List[str] = []
+        self._last_frame_token = None  # Change token of the last list frame drawn
+        # (country, flag, upper-case hex) per hex code; fixed for an aircraft
+        self._aircraft_meta: Dict[str, Tuple[str, str, str]] = {}
+        # Formatted list rows per hex code, keyed by the fields they were built from
+        self._row_cache: Dict[str, Tuple[tuple, str]] = {}
+
+        # Self-pipe that wakes the loop's select() when another thread needs a redraw
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+
+        # On a terminal, frames go straight to the fd in one write, skipping
+        # sys.stdout's lock and text layer; pipes and files keep using sys.stdout
+        self._out_fd = None
+        try:
+            if sys.stdout.isatty():
+                self._out_fd = sys.stdout.fileno()
+        except (AttributeError, ValueError, OSError):
+            pass
+        self._encoding = sys.stdout.encoding or "utf-8"
 
         config = get_config()
         self.monitor_aircraft_type = config.get_monitor_aircraft_type()
 
         # Get terminal dimensions
-        try:
-            import shutil
-
-            self.screen_width, self.screen_height = shutil.get_terminal_size()
-        except:
-            self.screen_width = 70
-            self.screen_height = 20
+        size = shutil.get_terminal_size(fallback=(70, 20))
+        self.screen_width, self.screen_height = size.columns, size.lines
 
     def _clear_screen(self):
         """Clear the terminal screen"""
-        print(
-            "\033[2J\033[H", end=""
-        )  # ANSI escape codes for clear screen and move cursor to top
-
-    def _get_sorted_aircraft_list(self) -> List[tuple]:
-        """Get sorted list of aircraft (hex_code, info) tuples"""
-        return sorted(
-            self.aircraft_history.items(),
-            key=lambda x: (x[0], -int(x[1]["last_seen"].timestamp())),
-        )
+        if self._out_fd is None:
+            self._emit([_CLEAR])
+        else:
+            sys.stdout.flush()
+            self._write_out(_CLEAR_BYTES)
+        self._prev_lines = []
+
+    def _emit(self, parts: List[str]):
+        """Write the given parts to the terminal as a single write"""
+        frame = "".join(parts)
+        if self._out_fd is None:
+            sys.stdout.write(frame)
+            sys.stdout.flush()
+            return
+
+        # Flush anything other code printed so it lands before this frame
+        sys.stdout.flush()
+        self._write_out(frame.encode(self._encoding, "replace"))
+
+    def _write_out(self, data: bytes):
+        """Write raw bytes to the terminal fd, retrying on short writes"""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._out_fd, view) :]
+
+    def _draw(self, lines: List[str]):
+        """
+        Draw a frame, rewriting only the rows that changed since the last one
+
+        The last line is the input prompt; the cursor is left at its end.
+        """
+        prev = self._prev_lines
+
+        # Re-read the size so a resized terminal forces a full redraw
+        size = shutil.get_terminal_size(fallback=(70, 20))
+        resized = (size.columns, size.lines) != (self.screen_width, self.screen_height)
+        self.screen_width, self.screen_height = size.columns, size.lines
+
+        # Row N of the frame is only row N on screen when nothing wraps and the
+        # frame does not scroll, so otherwise redraw in full
+        if (
+            not prev
+            or resized
+            or len(lines) > self.screen_height
+            or max(map(_display_width, lines)) > self.screen_width
+        ):
+            out = [_CLEAR, "\n".join(lines)]
+        else:
+            out = []
+            for row, line in enumerate(lines, 1):
+                if row > len(prev) or prev[row - 1] != line:
+                    out.append(f"\033[{row};1H\033[2K{line}")
+            if len(lines) < len(prev):
+                out.append(f"\033[{len(lines) + 1};1H\033[J")
+            out.append(f"\033[{len(lines)};{_display_width(lines[-1]) + 1}H")
+
+        self._emit(out)
+        self._prev_lines = lines
+
+    def _get_sorted_aircraft_list(self, limit: int) -> List[tuple]:
+        """Get the first `limit` aircraft (hex_code, info) tuples sorted by hex code"""
+        history = self.aircraft_history
+        aircraft_list = []
+        for hex_code in self._sorted_hex:
+            if len(aircraft_list) >= limit:
+                break
+            # Skip entries the monitor removed but has not reported yet
+            info = history.get(hex_code)
+            if info is not None:
+                aircraft_list.append((hex_code, info))
+        return aircraft_list
 
     def _is_aircraft_new(self, hex_code: str) -> bool:
         """Check if aircraft should show [NEW] tag"""
-        if hex_code not in self.new_aircraft_tags:
-            return False
-
-        tag_time = self.new_aircraft_tags[hex_code]
-        return (datetime.now() - tag_time).total_seconds() < self.new_tag_duration
+        expiry = self.new_aircraft_tags.get(hex_code)
+        return expiry is not None and expiry > time.monotonic()
 
     def _cleanup_new_tags(self):
         """Remove expired [NEW] tags"""
-        current_time = datetime.now()
-        expired_tags = []
-
-        for hex_code, tag_time in self.new_aircraft_tags.items():
-            if (current_time - tag_time).total_seconds() >= self.new_tag_duration:
-                expired_tags.append(hex_code)
+        now = time.monotonic()
+        # Copy the items first: the monitor thread may add tags meanwhile
+        expired_tags = [
+            hex_code
+            for hex_code, expiry in list(self.new_aircraft_tags.items())
+            if expiry <= now
+        ]
 
         for hex_code in expired_tags:
             del self.new_aircraft_tags[hex_code]
 
-    def _print_warnings(self):
-        """Print any warnings or important messages"""
+    def _warning_lines(self) -> List[str]:
+        """Get any warnings or important messages"""
+        lines = []
         if self.monitor_aircraft_type not in ["all", "registered"]:
-            print(
+            lines.append(
                 f"⚠️ Unknown monitor aircraft type: {self.monitor_aircraft_type}. "
                 "Defaulting to 'all'."
             )
 
         if not self.running:
-            print("⚠️ Visualization service is not running.")
-
-    def _render_aircraft_list(self):
-        """Render the aircraft list view"""
-        self._clear_screen()
-        self._cleanup_new_tags()
+            lines.append("⚠️ Visualization service is not running.")
+        return lines
+
+    def _get_aircraft_meta(self, hex_code: str) -> Tuple[str, str, str]:
+        """Get the (country, flag, upper-case hex) display fields for an aircraft"""
+        meta = self._aircraft_meta.get(hex_code)
+        if meta is None:
+            country = get_country_from_icao(hex_code)
+            meta = (country, get_country_flag(country), hex_code.upper())
+            self._aircraft_meta[hex_code] = meta
+        return meta
+
+    def _format_row(self, hex_code: str, info: dict) -> str:
+        """Format an aircraft list row (without its number), reusing the cached one"""
+        is_new = self._is_aircraft_new(hex_code)
+        key = (
+            info["last_seen"],
+            info.get("flight"),
+            info.get("altitude"),
+            info.get("speed"),
+            info.get("aircraft_type"),
+            is_new,
+        )
+        cached = self._row_cache.get(hex_code)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        print("=" * 76)
-        print("🛩️  PiPlane Tracker v1.0")
-        print("=" * 76)
-        print()
+        flight = info.get("flight", "Unknown")
+        last_seen = _format_hms(info["last_seen"])
 
-        aircraft_list = self._get_sorted_aircraft_list()
+        # Get country flag
+        _, country_flag, hex_upper = self._get_aircraft_meta(hex_code)
 
-        if aircraft_list:
-            # Show aircraft list with numbers
-            for i, (hex_code, info) in enumerate(
-                aircraft_list[:15]
-            ):  # Show max 15 aircraft
-                flight = info.get("flight", "Unknown")
-                last_seen = info["last_seen"].strftime("%H:%M:%S")
+        # New aircraft indicator
+        new_indicator = " [NEW]" if is_new else ""
 
-                # Get country flag
-                country = get_country_from_icao(hex_code)
-                country_flag = get_country_flag(country)
+        # Format additional aircraft data
+        altitude = info.get("altitude")
+        speed = info.get("speed")
+        aircraft_type = info.get("aircraft_type", "")
 
-                # New aircraft indicator
-                new_indicator = " [NEW]" if self._is_aircraft_new(hex_code) else ""
+        # Format altitude (feet) and speed (knots)
+        alt_str = _format_altitude(altitude)
+        speed_str = _format_speed(speed)
+
+        # Format aircraft type (truncate if too long)
+        type_str = aircraft_type[:8] if aircraft_type else ""
+
+        # Fixed-width columns padded with ljust and joined in one pass
+        row = "".join(
+            (
+                country_flag,
+                " ",
+                flight.ljust(10),
+                " (",
+                hex_upper,
+                ") ",
+                new_indicator.ljust(6),
+                " | ",
+                type_str.ljust(8),
+                " | ",
+                alt_str.ljust(8),
+                " | ",
+                speed_str.ljust(7),
+                " | ",
+                last_seen,
+            )
+        )
+        self._row_cache[hex_code] = (key, row)
+        return row
 
-                # Format additional aircraft data
-                altitude = info.get("altitude")
-                speed = info.get("speed")
-                aircraft_type = info.get("aircraft_type", "")
+    def _render_aircraft_list(self):
+        """Render the aircraft list view"""
+        self._cleanup_new_tags()
 
-                # Format altitude (feet)
-                alt_str = f"{altitude:,}ft" if altitude is not None else "N/A"
+        token = (
+            self.history_version,
+            frozenset(self.new_aircraft_tags),
+            self.running,
+        )
+        if token == self._last_frame_token and self._prev_lines:
+            return
+        self._last_frame_token = token
 
-                # Format speed (knots)
-                speed_str = f"{speed}kt" if speed is not None else "N/A"
+        lines = list(_LIST_HEADER)
 
-                # Format aircraft type (truncate if too long)
-                type_str = f"{aircraft_type[:8]}" if aircraft_type else ""
+        total = len(self.aircraft_history)
+        aircraft_list = self._get_sorted_aircraft_list(MAX_LIST_ROWS)
 
-                print(
-                    f"{i+1:2d}. {country_flag} {flight:<10} ({hex_code.upper()}) {new_indicator:<6} | {type_str:<8} | {alt_str:<8} | {speed_str:<7} | {last_seen}"
-                )
+        if aircraft_list:
+            # Show aircraft list with numbers
+            for i, (hex_code, info) in enumerate(aircraft_list):
+                lines.append(_ROW_PREFIXES[i] + self._format_row(hex_code, info))
         else:
-            print("No aircraft detected.")
+            lines.append("No aircraft detected.")
 
-        if len(aircraft_list) > 15:
-            print(f"... and {len(aircraft_list) - 15} more aircraft")
+        if total > MAX_LIST_ROWS:
+            lines.append(f"... and {total - MAX_LIST_ROWS} more aircraft")
 
-        print()
-        print("-" * 76)
-        self._print_warnings()
-        print()
-        print("  [Enter] Refresh")
-        print("  [1] Aircraft Details")
-        print("  [Q] Quit")
-        print("=" * 76)
-        print(">>> ", end="", flush=True)
+        lines.extend(_LIST_DIVIDER)
+        lines.extend(self._warning_lines())
+        lines.extend(_LIST_FOOTER)
+        self._draw(lines)
 
     def _render_aircraft_detail(self, hex_code: str):
         """Render detailed view of a specific aircraft"""
-        self._clear_screen()
-
         if hex_code not in self.aircraft_history:
-            print("Aircraft not found!")
-            print("\nPress Enter to go back")
+            self._draw(["Aircraft not found!", "", "Press Enter to go back"])
             return
 
         info = self.aircraft_history[hex_code]
 
-        print("🛩️  PiPlane Tracker - Aircraft Details")
-        print("=" * 76)
-        print()
+        lines = list(_DETAIL_HEADER)
 
         # Basic information
         flight = info.get("flight", "Unknown")
 
         # Get country information
-        country = get_country_from_icao(hex_code)
-        country_flag = get_country_flag(country)
+        country, country_flag, hex_upper = self._get_aircraft_meta(hex_code)
 
-        print(f"✈️ {flight} ({country}) {country_flag}")
-        print(f"🔖 ICAO Code: {hex_code.upper()}")
+        lines.append(f"✈️ {flight} ({country}) {country_flag}")
+        lines.append(f"🔖 ICAO Code: {hex_upper}")
 
         # Flight data information
         altitude = info.get("altitude")
@@ -191,39 +388,41 @@ class PiPlaneVisualizationService:
         registration = info.get("registration", "")
         operator = info.get("operator", "")
 
-        print(f"📏 Altitude: {f'{altitude:,} ft' if altitude is not None else 'N/A'}")
-        print(f"🏃 Speed: {f'{speed} knots' if speed is not None else 'N/A'}")
-        print(f"✈️ Aircraft Type: {aircraft_type if aircraft_type else 'N/A'}")
-        print(f"🏭 Manufacturer: {manufacturer if manufacturer else 'N/A'}")
-        print(f"🏷️ Registration: {registration if registration else 'N/A'}")
-        print(f"🏢 Operator: {operator if operator else 'N/A'}")
+        lines.append(
+            f"📏 Altitude: {f'{altitude:,} ft' if altitude is not None else 'N/A'}"
+        )
+        lines.append(f"🏃 Speed: {f'{speed} knots' if speed is not None else 'N/A'}")
+        lines.append(f"✈️ Aircraft Type: {aircraft_type if aircraft_type else 'N/A'}")
+        lines.append(f"🏭 Manufacturer: {manufacturer if manufacturer else 'N/A'}")
+        lines.append(f"🏷️ Registration: {registration if registration else 'N/A'}")
+        lines.append(f"🏢 Operator: {operator if operator else 'N/A'}")
 
         # Timing information
-        first_seen = info["first_seen"].strftime("%Y-%m-%d %H:%M:%S")
-        last_seen = info["last_seen"].strftime("%Y-%m-%d %H:%M:%S")
-        print(f"🕐 First seen: {first_seen}")
-        print(f"🕐 Last seen: {last_seen}")
+        first_seen = _format_datetime(info["first_seen"])
+        last_seen = _format_datetime(info["last_seen"])
+        lines.append(f"🕐 First seen: {first_seen}")
+        lines.append(f"🕐 Last seen: {last_seen}")
 
         # Calculate tracking duration
         duration = info["last_seen"] - info["first_seen"]
         duration_str = str(duration).split(".")[0]  # Remove microseconds
-        print(f"⏱️ Tracked for: {duration_str}")
+        lines.append(f"⏱️ Tracked for: {duration_str}")
 
         # Position information
         positions = info.get("positions", [])
 
         # Show recent positions if available
         if len(positions) > 1:
-            print("\n📊 Recent Position History:")
-            recent_positions = positions[-5:]  # Last 5 positions
-            for i, pos in enumerate(recent_positions):
-                time_str = pos["timestamp"].strftime("%H:%M:%S")
-                print(f"   {i+1}. {time_str} - {pos['lat']:.6f}, {pos['lon']:.6f}")
+            lines.append("")
+            lines.append("📊 Recent Position History:")
+            # Last 5 positions, read by index so the deque is not copied
+            recent_positions = [positions[i] for i in range(-min(5, len(positions)), 0)]
+            for i, (lat, lon, timestamp) in enumerate(recent_positions):
+                time_str = _format_hms(timestamp)
+                lines.append(f"   {i+1}. {time_str} - {lat:.6f}, {lon:.6f}")
 
-        print()
-        print("-" * 76)
-        print("[ENTER] Return to aircraft list")
-        print(">>> ", end="", flush=True)
+        lines.extend(_DETAIL_FOOTER)
+        self._draw(lines)
 
     def _has_input_available(self) -> bool:
         """Check if there's input available without blocking"""
@@ -231,12 +430,20 @@ class PiPlaneVisualizationService:
 
     def _get_non_blocking_input(self) -> Optional[str]:
         """Get input without blocking, returns None if no input available"""
-        if self._has_input_available():
-            try:
-                return input().strip().lower()
-            except (EOFError, KeyboardInterrupt):
-                return "q"
-        return None
+        if not self._has_input_available():
+            return None
+
+        # The terminal stays in canonical mode so echo and multi-digit choices
+        # keep working; once stdin is readable a whole line is waiting, and one
+        # os.read fetches it without going through sys.stdin's buffer
+        try:
+            data = os.read(sys.stdin.fileno(), 1024)
+        except KeyboardInterrupt:
+            return "q"
+
+        if not data:
+            return "q"  # End of input
+        return data.decode("utf-8", "ignore").split("\n", 1)[0].strip().lower()
 
     def _handle_user_input(self) -> bool:
         """Handle user input in a non-blocking way. Returns True if input was processed."""
@@ -245,34 +452,34 @@ class PiPlaneVisualizationService:
         if user_input is None:
             return False  # No input available
 
+        # The echoed input line moved the cursor, so the next frame is drawn in full
+        self._prev_lines = []
+
         if self.current_view == "list":
             if user_input in ["q", "quit", "exit"]:
                 self.running = False
             elif user_input.isdigit():
                 # User entered a number to view aircraft details
-                aircraft_list = self._get_sorted_aircraft_list()
                 index = int(user_input) - 1
+                aircraft_list = self._get_sorted_aircraft_list(index + 1)
                 if 0 <= index < len(aircraft_list):
                     self.selected_aircraft_hex = aircraft_list[index][0]
                     self.current_view = "detail"
                     return True
-            # If user just presses Enter, we refresh the list (trigger immediate refresh)
-            self.auto_refresh_needed = True
 
         elif self.current_view == "detail":
             # Any input goes back to list
             self.current_view = "list"
             self.selected_aircraft_hex = None
-            self.auto_refresh_needed = True
 
+        # Processed input always triggers a refresh, so a bare Enter refreshes the list
         return True
 
     def _visualization_loop(self):
         """Main visualization loop with auto-refresh"""
         try:
             # Initial render
-            current_time = time.time()
-            self.last_render_time = current_time
+            self.last_render_time = time.monotonic()
 
             if self.current_view == "list":
                 self._render_aircraft_list()
@@ -280,66 +487,106 @@ class PiPlaneVisualizationService:
                 self._render_aircraft_detail(self.selected_aircraft_hex)
 
             while self.running:
-                current_time = time.time()
+                # Sleep in select() until input, a wake-up, or the next refresh
+                deadline = min(
+                    self._refresh_at, self.last_render_time + self.render_interval
+                )
+                wait = max(0.0, deadline - time.monotonic())
+                ready, _, _ = select.select([sys.stdin, self._wake_r], [], [], wait)
+
+                if self._wake_r in ready:
+                    os.read(self._wake_r, 4096)  # Drain pending wake-ups
 
                 # Handle any user input
-                input_processed = self._handle_user_input()
+                input_processed = sys.stdin in ready and self._handle_user_input()
 
                 # Check if we need to refresh
+                current_time = time.monotonic()
                 should_refresh = (
-                    self.auto_refresh_needed
+                    input_processed
+                    or current_time >= self._refresh_at
                     or (current_time - self.last_render_time) >= self.render_interval
-                    or input_processed
                 )
 
                 if should_refresh:
+                    # Clear the request first so one made during the render is kept
+                    self._refresh_at = float("inf")
+                    self.last_render_time = current_time
+
                     # Render current view
                     if self.current_view == "list":
                         self._render_aircraft_list()
                     elif self.current_view == "detail" and self.selected_aircraft_hex:
                         self._render_aircraft_detail(self.selected_aircraft_hex)
 
-                    self.last_render_time = current_time
-                    self.auto_refresh_needed = False
-
-                # Small sleep to prevent high CPU usage
-                time.sleep(0.1)
-
         except Exception as e:
             print(f"Error in visualization loop: {e}")
         finally:
             self._clear_screen()
 
     def start(self):
-        """Start the visualization service"""
-        if self.thread and self.thread.is_alive():
+        """
+        Start the visualization service
+
+        Runs the visualization loop on the calling thread (the main thread)
+        and returns once the user quits or stop() is called.
+        """
+        if self.running:
             return
 
         self.running = True
-        # Don't run in a separate thread - run directly
         self._visualization_loop()
 
     def stop(self):
         """Stop the visualization service"""
         self.running = False
+        self._wake()
+
+    def _request_refresh(self):
+        """Schedule a redraw shortly, coalescing bursts of updates into one"""
+        self._refresh_at = min(self._refresh_at, time.monotonic() + REFRESH_DEBOUNCE)
+        self._wake()
+
+    def _wake(self):
+        """Interrupt the loop's select() so it acts on new state right away"""
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            # Pipe already full (a wake-up is pending anyway) or closed by cleanup
+            pass
 
     def add_new_aircraft(self, hex_code: str):
         """Mark an aircraft as new for [NEW] tag display and trigger immediate refresh"""
-        self.new_aircraft_tags[hex_code] = datetime.now()
-        self.auto_refresh_needed = (
-            True  # Trigger immediate refresh when new aircraft is added
-        )
+        self.add_new_aircrafts({hex_code})
+
+    def add_new_aircrafts(self, hex_codes: set[str]):
+        """Mark several aircraft as new in one update and trigger a single refresh"""
+        expiry = time.monotonic() + self.new_tag_duration
+        self.new_aircraft_tags.update(dict.fromkeys(hex_codes, expiry))
+
+        sorted_hex = list(self._sorted_hex)
+        for hex_code in hex_codes:
+            index = bisect.bisect_left(sorted_hex, hex_code)
+            if index == len(sorted_hex) or sorted_hex[index] != hex_code:
+                sorted_hex.insert(index, hex_code)
+        self._sorted_hex = sorted_hex
+        self._request_refresh()  # Trigger refresh when new aircraft are added
 
     def remove_aircraft(self, hex_codes: set[str]):
         """Remove aircraft from new tags when they're removed from history"""
         for hex_code in hex_codes:
             if hex_code in self.new_aircraft_tags:
                 del self.new_aircraft_tags[hex_code]
-        self.auto_refresh_needed = True  # Trigger refresh when aircraft are removed
+            self._row_cache.pop(hex_code, None)
+            self._aircraft_meta.pop(hex_code, None)
+        self._sorted_hex = [h for h in self._sorted_hex if h not in hex_codes]
+        self._request_refresh()  # Trigger refresh when aircraft are removed
 
     def update_aircraft_history(self, aircraft_history: Dict[str, dict]):
         """Update the aircraft history reference"""
         self.aircraft_history = aircraft_history
+        self._sorted_hex = sorted(aircraft_history)
+        self._request_refresh()
 
     def is_running(self) -> bool:
         """Check if the visualization service is running"""
@@ -349,3 +596,9 @@ class PiPlaneVisualizationService:
         """Cleanup resources"""
         self.stop()
         self._clear_screen()
+
+        # Close the wake pipe; -1 makes any later _wake() fail harmlessly
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r = self._wake_w = -1